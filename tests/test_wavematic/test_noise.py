@@ -1,6 +1,10 @@
-from pandas._testing import assert_series_equal
+import numpy as np
+import pandas as pd
+import pytest
+from pandas._testing import assert_index_equal, assert_series_equal
 
 from wavematic import Noise, TimeAxis
+from wavematic.wave import _LATTICE_GRADS, _get_perlin1d_numba, _perlin1d_numpy
 
 from ..data import data
 
@@ -12,5 +16,38 @@ def test_noise():
     ta_ser = ta.get()
     assert len(noise_ser) == 100
     assert noise_ser.name == "Foo"
-    assert_series_equal(ta_ser, noise_ser.index.to_series().reset_index(drop=True))
+    assert_index_equal(noise_ser.index, pd.Index(ta_ser))
     assert_series_equal(noise_ser, data["noise1"])
+
+
+def test_noise_no_amp():
+    ta = TimeAxis(duration=1.0, rate=100.0, start=0.0)
+    noise_ser = Noise(ta=ta, amp=0.0).get()
+    assert len(noise_ser) == 100
+    assert (noise_ser == 0.0).all()
+
+
+def test_noise_numba():
+    _perlin1d_numba = _get_perlin1d_numba()
+    if _perlin1d_numba is None:
+        pytest.skip("Numba is not installed")
+
+    x = np.linspace(-50.0, 50.0, 1001, dtype=np.float32)
+    args = (Noise.octaves, Noise.persistence, Noise.lacunarity, Noise.repeat, 3)
+    np.testing.assert_array_equal(
+        _perlin1d_numba(x, *args, _LATTICE_GRADS),
+        _perlin1d_numpy(x, *args, _LATTICE_GRADS),
+    )
+
+
+def test_noise_tuning():
+    ta = TimeAxis(duration=1.0, rate=100.0, start=0.0)
+    noise = Noise(ta=ta, amp=1.0)
+    noise.octaves = 4
+    assert Noise.octaves == 20
+    assert Noise(ta=ta, amp=1.0).octaves == 20
+    x = ta.get().to_numpy().astype(np.float32)
+    args = (4, Noise.persistence, Noise.lacunarity, Noise.repeat, 0)
+    np.testing.assert_allclose(
+        noise.get().to_numpy(), _perlin1d_numpy(x, *args, _LATTICE_GRADS)
+    )
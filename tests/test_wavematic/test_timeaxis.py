@@ -1,7 +1,10 @@
+from copy import copy, deepcopy
+
+import numpy as np
 import pytest
-from pytest import raises
+from pytest import approx, raises
 
-from wavematic import TimeAxis
+from wavematic import Noise, TimeAxis, Wave
 
 """
 ta = TimeAxis(duration=0.2, rate=1600.0, start=0.0)
@@ -33,43 +36,45 @@ def test_timeaxis():
     ta_ser = ta.get()
     assert len(ta_ser) == 20
     assert ta_ser.iloc[0] == 0.0
-    assert ta_ser.iloc[-1] == 2.0
+    assert ta_ser.iloc[-1] == approx(1.9)
     assert repr(ta) == "TimeAxis(duration=2.0, rate=10.0, start=0.0)"
+    with raises(ValueError):
+        ta_ser.iloc[0] = 1.0
+    ta_ser += 1.0
+    ta_ser.name = "time"
+    ta_ser.index += 1
+    ta_ser2 = ta.get()
+    assert ta_ser2.iloc[0] == 0.0
+    assert ta_ser2.name is None
+    assert ta_ser2.index[0] == 0
 
     ta.start = 5.0
     ta_ser = ta.get()
     assert len(ta_ser) == 20
     assert ta_ser.iloc[0] == 5.0
-    assert ta_ser.iloc[-1] == 7.0
+    assert ta_ser.iloc[-1] == approx(6.9)
     assert repr(ta) == "TimeAxis(duration=2.0, rate=10.0, start=5.0)"
 
     with raises(TypeError):
-        ta = TimeAxis(duration="bad", rate=1.0, start=1.0)
-        ta.get()
+        TimeAxis(duration="bad", rate=1.0, start=1.0)
 
     with raises(TypeError):
-        ta = TimeAxis(duration=1.0, rate="bad", start=1.0)
-        ta.get()
+        TimeAxis(duration=1.0, rate="bad", start=1.0)
 
     with raises(TypeError):
-        ta = TimeAxis(duration=1.0, rate=1.0, start="bad")
-        ta.get()
+        TimeAxis(duration=1.0, rate=1.0, start="bad")
 
     with raises(TypeError):
-        ta = TimeAxis(duration="bad", rate="bad", start=1.0)
-        ta.get()
+        TimeAxis(duration="bad", rate="bad", start=1.0)
 
     with raises(TypeError):
-        ta = TimeAxis(duration="bad", rate=1.0, start="bad")
-        ta.get()
+        TimeAxis(duration="bad", rate=1.0, start="bad")
 
     with raises(TypeError):
-        ta = TimeAxis(duration=1.0, rate="bad", start="bad")
-        ta.get()
+        TimeAxis(duration=1.0, rate="bad", start="bad")
 
     with raises(TypeError):
-        ta = TimeAxis(duration="bad", rate="bad", start="bad")
-        ta.get()
+        TimeAxis(duration="bad", rate="bad", start="bad")
 
     with raises(ValueError):
         ta = TimeAxis(duration=-1.0, rate=1.0, start=1.0)
@@ -84,10 +89,28 @@ def test_timeaxis():
     ta_ser = ta.get()
     assert len(ta_ser) == 10
     assert ta_ser.iloc[0] == -1.0
-    assert ta_ser.iloc[-1] == 0.0
+    assert ta_ser.iloc[-1] == approx(-0.1)
     assert repr(ta) == "TimeAxis(duration=1.0, rate=10.0, start=-1.0)"
 
 
+def test_timeaxis_dtype():
+    ta = TimeAxis(duration=1.0, rate=10.0, dtype=np.float32)
+    ta_ser = ta.get()
+    assert ta_ser.dtype == np.float32
+    assert len(ta_ser) == 10
+    assert ta_ser.iloc[-1] == approx(0.9)
+    assert repr(ta) == "TimeAxis(duration=1.0, rate=10.0, start=0.0, dtype='float32')"
+
+    wave_ser = Wave(ta=ta, freq=1.0, amp=1.0, kind="square").get()
+    assert wave_ser.dtype == np.float32
+    noise_ser = Noise(ta=ta, amp=1.0).get()
+    assert noise_ser.dtype == np.float32
+
+    for dtype in (np.int64, np.float16, np.complex128, "U3", "bad"):
+        with raises(TypeError):
+            TimeAxis(duration=1.0, rate=10.0, dtype=dtype)
+
+
 values = [0.0, 0.1, 1.0, 10.0]
 
 
@@ -98,3 +121,18 @@ def test_timeaxis_multi(duration, rate, start):
     ta = TimeAxis(duration=duration, rate=rate, start=start)
     assert ta is not None
     assert ta.get() is not None
+
+
+def test_timeaxis_copy_subclass():
+    class MyTimeAxis(TimeAxis):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.unit = ["s"]
+
+    ta = MyTimeAxis(duration=1.0, rate=10.0)
+    ta_copy = copy(ta)
+    assert ta_copy.unit is ta.unit
+    assert len(ta_copy.get()) == 10
+    ta_deepcopy = deepcopy(ta)
+    assert ta_deepcopy.unit == ["s"]
+    assert ta_deepcopy.unit is not ta.unit
@@ -0,0 +1,71 @@
+from copy import copy, deepcopy
+
+import numpy as np
+import pytest
+
+from wavematic import TimeAxis, Wave
+
+
+def test_wave_freq_phase_setters():
+    ta = TimeAxis(duration=1.0, rate=1000.0)
+    t = ta.get().to_numpy()
+    wave = Wave(ta=ta, amp=0.8, disp=0.1)
+    wave.freq = 5.0
+    wave.phase = 0.5
+    expected = np.sin(2 * np.pi * 5.0 * t + np.pi * 0.5) * 0.8 + 0.1
+    np.testing.assert_allclose(wave.get().to_numpy(), expected)
+
+
+@pytest.mark.parametrize(
+    "kind, kwargs",
+    [
+        ("square", {}),
+        ("square", {"duty": 0.25}),
+        ("sawtooth", {}),
+        ("sawtooth", {"width": 0.5}),
+    ],
+)
+def test_wave_kinds(kind, kwargs):
+    signal = pytest.importorskip("scipy.signal")
+    ta = TimeAxis(duration=1.0, rate=1000.0)
+    t = ta.get().to_numpy()
+    wave = Wave(ta=ta, freq=5.0, amp=0.8, phase=0.5, disp=0.1, kind=kind, **kwargs)
+    func = getattr(signal, kind)
+    expected = func(2 * np.pi * 5.0 * t + np.pi * 0.5, **kwargs) * 0.8 + 0.1
+    np.testing.assert_allclose(wave.get().to_numpy(), expected)
+
+
+def test_wave_no_amp():
+    ta = TimeAxis(duration=1.0, rate=1000.0)
+    wave = Wave(ta=ta, freq=5.0, amp=0.0, disp=0.3)
+    wave_ser = wave.get()
+    assert len(wave_ser) == 1000
+    assert (wave_ser == 0.3).all()
+
+
+def test_wave_copy_freq():
+    ta = TimeAxis(duration=1.0, rate=1000.0)
+    t = ta.get().to_numpy()
+    wave = Wave(ta=ta, freq=5.0, amp=0.8, phase=0.5)
+    wave_copy = wave.copy()
+    wave_copy.freq = 10.0
+    wave_copy.phase = 1.0
+    expected = np.sin(2 * np.pi * 10.0 * t + np.pi * 1.0) * 0.8
+    np.testing.assert_allclose(wave_copy.get().to_numpy(), expected)
+    expected = np.sin(2 * np.pi * 5.0 * t + np.pi * 0.5) * 0.8
+    np.testing.assert_allclose(wave.get().to_numpy(), expected)
+
+
+def test_wave_copy_subclass():
+    class MyWave(Wave):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.extra = [1]
+
+    wave = MyWave(freq=5.0)
+    wave_copy = copy(wave)
+    assert wave_copy.extra is wave.extra
+    assert wave_copy.freq == 5.0
+    wave_deepcopy = deepcopy(wave)
+    assert wave_deepcopy.extra == [1]
+    assert wave_deepcopy.extra is not wave.extra
@@ -0,0 +1,198 @@
+from copy import deepcopy
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from wavematic import Noise, TimeAxis, Wave, Wavematic
+from wavematic.wave import Signal
+
+
+class Ramp(Signal):
+    """Signal implementing only `get`."""
+
+    def get(self, ta=None):
+        ta_ser = (ta or self.ta).get()
+        return pd.Series(ta_ser.to_numpy() * 2.0, index=ta_ser.to_numpy())
+
+
+class Recorded(Signal):
+    """Signal returning fixed samples, regardless of the time axis."""
+
+    def get(self, ta=None):
+        return pd.Series([1.0, 2.0, 3.0], index=[0.0, 0.25, 2.0], name=self.name)
+
+
+class Gap(Signal):
+    """Signal implementing only `get`, with a missing first sample."""
+
+    def get(self, ta=None):
+        t = (ta or self.ta).get().to_numpy()
+        values = np.full(len(t), 2.0)
+        values[0] = np.nan
+        return pd.Series(values, index=t, name=self.name)
+
+
+def test_wavematic_get_only_signal():
+    ta = TimeAxis(duration=1.0, rate=10.0)
+    wm = Wavematic(ta)
+    wm += Ramp()
+    wm += Wave(disp=1.0)
+    t = ta.get().to_numpy()
+
+    np.testing.assert_array_equal(wm.get().to_numpy(), t * 2.0 + 1.0)
+    assert list(wm.all_signals().columns) == [0, 1]
+
+
+def test_wavematic_get_only_signal_own_index():
+    ta = TimeAxis(duration=1.0, rate=4.0)
+    wm = Wavematic(ta)
+    wm += Wave(disp=1.0)
+    wm += Recorded(name="rec")
+
+    df = wm.all_signals()
+    np.testing.assert_array_equal(df.index, [0.0, 0.25, 0.5, 0.75, 2.0])
+    np.testing.assert_array_equal(df["rec"].dropna(), [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(df["rec"].dropna().index, [0.0, 0.25, 2.0])
+
+    out = wm.get()
+    np.testing.assert_array_equal(out.index, df.index)
+    np.testing.assert_array_equal(out, [2.0, 3.0, 1.0, 1.0, 3.0])
+
+
+def test_wavematic_force_self_ta():
+    ta = TimeAxis(duration=1.0, rate=10.0)
+    wm = Wavematic(ta)
+    wm += Wave(ta=TimeAxis(duration=2.0, rate=10.0), disp=1.0)
+    assert len(wm.get()) == 20
+
+    wm.force_self_ta = True
+    assert len(wm.get()) == 10
+    assert wm.copy().force_self_ta
+    assert not Wavematic(ta).force_self_ta
+
+    try:
+        Wavematic.force_self_ta = True
+        other = Wavematic(ta)
+        other += Wave(ta=TimeAxis(duration=2.0, rate=10.0), disp=1.0)
+        assert other.force_self_ta
+        assert len(other.get()) == 10
+        other.force_self_ta = False
+        assert len(other.get()) == 20
+    finally:
+        Wavematic.force_self_ta = False
+
+
+def test_wavematic_base_axis():
+    ta = TimeAxis(duration=1.0, rate=100.0)
+    t = ta.get().to_numpy()
+    wm = Wavematic(ta, name="Sum")
+    wm += Wave(freq=2.0, amp=1.0)
+    wm += Wave(freq=3.0, amp=0.5, phase=0.5, name="Second")
+    wm += Noise(amp=0.2)
+
+    df = wm.all_signals()
+    assert list(df.columns) == [0, "Second", "Noise"]
+    np.testing.assert_array_equal(df.index, t)
+    np.testing.assert_allclose(df[0], np.sin(2 * np.pi * 2.0 * t))
+
+    out = wm.get()
+    assert out.name == "Sum"
+    np.testing.assert_array_equal(out.index, t)
+    np.testing.assert_allclose(out, df.sum(axis=1))
+
+
+def test_wavematic_own_axis():
+    ta = TimeAxis(duration=1.0, rate=10.0)
+    wm = Wavematic(ta)
+    wm += Wave(disp=1.0)
+    wm += Wave(ta=TimeAxis(duration=1.0, rate=10.0), disp=2.0)
+    with mock.patch.object(Wavematic, "all_signals") as all_signals:
+        out = wm.get()
+    all_signals.assert_not_called()
+    assert len(out) == 10
+    assert (out == 3.0).all()
+
+
+def test_wavematic_mismatched_axis():
+    ta = TimeAxis(duration=1.0, rate=4.0)
+    other = Wave(ta=TimeAxis(duration=1.0, rate=4.0, start=0.5), disp=2.0)
+    wm = Wavematic(ta)
+    wm += Wave(disp=1.0)
+    wm += other
+
+    df = wm.all_signals()
+    np.testing.assert_array_equal(df.index, [0.0, 0.25, 0.5, 0.75, 1.0, 1.25])
+    assert df[0].isna().sum() == 2
+    assert df[1].isna().sum() == 2
+
+    with mock.patch.object(Wave, "get", autospec=True, side_effect=Wave.get) as get:
+        out = wm.get()
+    # Only generated once, by the aligned fallback.
+    assert get.call_count == 1
+    np.testing.assert_array_equal(out, [1.0, 1.0, 3.0, 3.0, 2.0, 2.0])
+
+
+def test_wavematic_nan():
+    ta = TimeAxis(duration=1.0, rate=4.0)
+    for gap in (Gap(), Gap(ta=ta)):
+        wm = Wavematic(ta)
+        wm += Wave(disp=1.0)
+        wm += gap
+
+        out = wm.get()
+        np.testing.assert_array_equal(out, wm.all_signals().sum(axis=1))
+        np.testing.assert_array_equal(out, [1.0, 3.0, 3.0, 3.0])
+
+
+def test_wavematic_get_ta():
+    wm = Wavematic(TimeAxis(duration=1.0, rate=10.0))
+    wm += Wave(disp=1.0)
+    wm += Wave(ta=TimeAxis(duration=5.0, rate=10.0), disp=2.0)
+    out = wm.get(TimeAxis(duration=2.0, rate=10.0))
+    assert len(out) == 20
+    assert (out == 3.0).all()
+
+
+def test_wavematic_empty():
+    wm = Wavematic(TimeAxis(duration=1.0, rate=10.0))
+    assert wm.all_signals().empty
+    assert wm.get().empty
+
+
+def test_wavematic_nested():
+    ta = TimeAxis(duration=1.0, rate=10.0)
+    inner = Wavematic()
+    inner += Wave(disp=1.0)
+    inner += Wave(freq=1.0, amp=1.0)
+    outer = Wavematic(ta)
+    outer += inner
+    outer += Wave(disp=0.5)
+
+    t = ta.get().to_numpy()
+    np.testing.assert_allclose(outer.get(), np.sin(2 * np.pi * t) + 1.5)
+    assert list(outer.all_signals().columns) == [0, 1]
+
+
+def test_wavematic_deepcopy():
+    ta = TimeAxis(duration=1.0, rate=100.0)
+    wm = Wavematic(ta, name="Sum")
+    wm += Wave(ta=ta, freq=2.0, amp=1.0)
+    wm += Wave(ta=ta, freq=3.0, amp=0.5, kind="square", duty=0.25)
+    before = wm.get()
+
+    wm_copy = deepcopy(wm)
+    assert wm_copy.ta is not ta
+    assert all(sig.ta is wm_copy.ta for sig in wm_copy.signals)
+    pd.testing.assert_series_equal(wm_copy.get(), before)
+
+    wm_copy.signals[0].freq = 5.0
+    wm_copy.signals[1].kwargs["duty"] = 0.75
+    wm_copy += Wave(freq=4.0, amp=0.3)
+    wm_copy.ta.rate = 50.0
+    assert len(wm.signals) == 2
+    assert wm.signals[0].freq == 2.0
+    assert wm.signals[1].kwargs == {"duty": 0.25}
+    assert ta.rate == 100.0
+    pd.testing.assert_series_equal(wm.get(), before)
+    assert len(wm_copy.get()) == 50
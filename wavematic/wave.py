@@ -1,17 +1,187 @@
 from abc import ABC, abstractmethod
 from copy import copy, deepcopy
-from typing import Any, List, Optional
+from functools import lru_cache
+from numbers import Real
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
-from noise import pnoise1
-from scipy import signal
-
 
 class MissingTimeAxis(Exception):
     pass
 
 
+@lru_cache(maxsize=None)
+def _get_signal() -> ModuleType:
+    """Import `scipy.signal` on first use, as it's slow to import."""
+    from scipy import signal
+
+    return signal
+
+
+# Ken Perlin's reference permutation, the same one used by `noise.pnoise1`.
+# fmt: off
+_PERM = np.array(
+    [
+        151, 160, 137, 91, 90, 15, 131, 13, 201, 95, 96, 53, 194, 233, 7, 225, 140, 36,
+        103, 30, 69, 142, 8, 99, 37, 240, 21, 10, 23, 190, 6, 148, 247, 120, 234, 75, 0,
+        26, 197, 62, 94, 252, 219, 203, 117, 35, 11, 32, 57, 177, 33, 88, 237, 149, 56,
+        87, 174, 20, 125, 136, 171, 168, 68, 175, 74, 165, 71, 134, 139, 48, 27, 166,
+        77, 146, 158, 231, 83, 111, 229, 122, 60, 211, 133, 230, 220, 105, 92, 41, 55,
+        46, 245, 40, 244, 102, 143, 54, 65, 25, 63, 161, 1, 216, 80, 73, 209, 76, 132,
+        187, 208, 89, 18, 169, 200, 196, 135, 130, 116, 188, 159, 86, 164, 100, 109,
+        198, 173, 186, 3, 64, 52, 217, 226, 250, 124, 123, 5, 202, 38, 147, 118, 126,
+        255, 82, 85, 212, 207, 206, 59, 227, 47, 16, 58, 17, 182, 189, 28, 42, 223, 183,
+        170, 213, 119, 248, 152, 2, 44, 154, 163, 70, 221, 153, 101, 155, 167, 43, 172,
+        9, 129, 22, 39, 253, 19, 98, 108, 110, 79, 113, 224, 232, 178, 185, 112, 104,
+        218, 246, 97, 228, 251, 34, 242, 193, 238, 210, 144, 12, 191, 179, 162, 241, 81,
+        51, 145, 235, 249, 14, 239, 107, 49, 192, 214, 31, 181, 199, 106, 157, 184, 84,
+        204, 176, 115, 121, 50, 45, 127, 4, 150, 254, 138, 236, 205, 93, 222, 114, 67,
+        29, 24, 72, 243, 141, 128, 195, 78, 66, 215, 61, 156, 180,
+    ],
+    dtype=np.int64,
+)
+# fmt: on
+
+# 1D gradient for each 4-bit hash: 1 to 8, or -1 if the highest bit is set.
+_GRAD1 = np.array([1, 2, 3, 4, 5, 6, 7, 8] + [-1] * 8, dtype=np.float32)
+
+# Gradient of each of the 256 lattice cells, with the permutation folded in.
+# The seed only offsets the cell index, so this 1 KiB table is shared by every
+# seed and the kernels do a single lookup per lattice point.
+_LATTICE_GRADS = _GRAD1[_PERM & 15]
+
+
+def _perlin1d(
+    x: np.ndarray,
+    octaves: int,
+    persistence: float,
+    lacunarity: float,
+    repeat: int,
+    base: int,
+) -> np.ndarray:
+    """1D Perlin noise.
+
+    Equivalent to calling `noise.pnoise1` on each value, including its single
+    precision arithmetic, but evaluated for the whole array at once. Uses the
+    compiled kernel if Numba is installed. Returns single precision values.
+    """
+
+    x = np.asarray(x, dtype=np.float32)
+    args = (octaves, persistence, lacunarity, repeat, base, _LATTICE_GRADS)
+    perlin1d_numba = _get_perlin1d_numba()
+    if perlin1d_numba is not None:
+        return perlin1d_numba(x, *args)
+    return _perlin1d_numpy(x, *args)
+
+
+def _perlin1d_numpy(
+    x: np.ndarray,
+    octaves: int,
+    persistence: float,
+    lacunarity: float,
+    repeat: int,
+    base: int,
+    grads: np.ndarray,
+) -> np.ndarray:
+    """Vectorized 1D Perlin noise, one octave at a time."""
+
+    total = np.zeros_like(x)
+    max_amp = np.float32(0.0)
+    freq = np.float32(1.0)
+    amp = np.float32(1.0)
+    for _ in range(octaves):
+        xo = x * freq
+        xo_floor = np.floor(xo)
+        period = int(repeat * freq)
+        i = np.fmod(xo_floor.astype(np.int64), period)
+        ii = np.fmod(i + 1, period)
+        g0 = grads[(i + base) & 255]
+        g1 = grads[(ii + base) & 255]
+
+        xf = xo - xo_floor
+        fade = xf * xf * xf * (xf * (xf * 6 - 15) + 10)
+        n0 = g0 * xf
+        n1 = g1 * (xf - 1)
+        total += (n0 + fade * (n1 - n0)) * np.float32(0.4) * amp
+
+        max_amp += amp
+        freq *= np.float32(lacunarity)
+        amp *= np.float32(persistence)
+    return total / max_amp
+
+
+def _perlin1d_loop(
+    x: np.ndarray,
+    octaves: int,
+    persistence: float,
+    lacunarity: float,
+    repeat: int,
+    base: int,
+    grads: np.ndarray,
+) -> np.ndarray:
+    """1D Perlin noise, with all octaves of a sample at a time.
+
+    Too slow to run as plain Python, meant to be compiled with Numba.
+    """
+
+    # Keep every constant in single precision, matching `_perlin1d_numpy`.
+    persistence32 = np.float32(persistence)
+    lacunarity32 = np.float32(lacunarity)
+    one = np.float32(1.0)
+    six = np.float32(6.0)
+    fifteen = np.float32(15.0)
+    ten = np.float32(10.0)
+    scale = np.float32(0.4)
+
+    out = np.empty_like(x)
+    for k in range(x.shape[0]):
+        total = np.float32(0.0)
+        max_amp = np.float32(0.0)
+        freq = one
+        amp = one
+        for _ in range(octaves):
+            xo = x[k] * freq
+            xo_floor = np.floor(xo)
+            period = int(repeat * freq)
+            # Truncated remainder, like `np.fmod` and C's `%`.
+            i = int(xo_floor) % period
+            if i > 0 and xo_floor < 0:
+                i -= period
+            ii = (i + 1) % period
+            if ii > 0 and i + 1 < 0:
+                ii -= period
+            g0 = grads[(i + base) & 255]
+            g1 = grads[(ii + base) & 255]
+
+            xf = xo - xo_floor
+            fade = xf * xf * xf * (xf * (xf * six - fifteen) + ten)
+            n0 = g0 * xf
+            n1 = g1 * (xf - one)
+            total += (n0 + fade * (n1 - n0)) * scale * amp
+
+            max_amp += amp
+            freq *= lacunarity32
+            amp *= persistence32
+        out[k] = total / max_amp
+    return out
+
+
+@lru_cache(maxsize=None)
+def _get_perlin1d_numba() -> Optional[Callable[..., np.ndarray]]:
+    """Compile `_perlin1d_loop` on first use, or `None` if Numba is missing.
+
+    Numba is imported here rather than at module level, as it's slow to import.
+    """
+
+    try:
+        import numba
+    except ImportError:  # pragma: no cover
+        return None
+    return numba.njit(cache=True)(_perlin1d_loop)
+
+
 class TimeAxis:
     """Generates a time axis.
 
@@ -22,37 +192,105 @@ class TimeAxis:
             Sampling rate (points per unit of time). Non-negative.
         start:
             Initial time.
+        dtype:
+            Floating point type of the time axis, `np.float64` or `np.float32`.
+            Signals generated on it use the same type, so `np.float32` halves
+            their memory use at the cost of precision.
     """
 
-    def __init__(self, duration: float, rate: float, start: float = 0.0):
+    __slots__ = ("duration", "rate", "start", "dtype", "_cache", "_cache_key")
+
+    def __init__(
+        self,
+        duration: float,
+        rate: float,
+        start: float = 0.0,
+        dtype: Union[str, type, np.dtype] = np.float64,
+    ):
+        for arg, value in (("duration", duration), ("rate", rate), ("start", start)):
+            if not isinstance(value, Real):
+                raise TypeError(f"`{arg}` must be a real number.")
         if duration < 0:
             raise ValueError("`duration` must be non-negative.")
         if rate < 0:
             raise ValueError("`rate` must be non-negative.")
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise TypeError("`dtype` must be `np.float32` or `np.float64`.")
+
+        self.duration = float(duration)
+        self.rate = float(rate)
+        self.start = float(start)
+        self.dtype = dtype
 
-        self.duration = duration
-        self.rate = rate
-        self.start = start
+        self._cache: Optional[np.ndarray] = None
+        self._cache_key: Optional[Tuple[float, float, float, np.dtype]] = None
 
     def get(self) -> pd.Series:
         """Generate the time axis.
 
+        Samples are spaced by `1 / rate`, starting at `start`, so the end of the
+        time axis (`start + duration`) is not included.
+
+        The values are cached until `duration`, `rate`, `start` or `dtype`
+        change, so consecutive calls return new series sharing the same
+        read-only array.
+
         Returns:
             Generated time axis.
         """
 
-        start = self.start
-        t = self.duration
-        stop = start + t
-        r = self.rate
-        return pd.Series(np.linspace(start, stop, int(r * t)))
+        key = (self.duration, self.rate, self.start, self.dtype)
+        if key != self._cache_key:
+            start = self.start
+            t = self.duration
+            r = self.rate
+            dtype = self.dtype
+            n = int(r * t)
+            step = 1.0 / r if r else 0.0
+            values = np.arange(n, dtype=dtype)
+            values *= step
+            values += start
+            # Shared between calls and by the signals' indexes, so make sure it
+            # isn't modified in place.
+            values.flags.writeable = False
+            self._cache = values
+            self._cache_key = key
+        # A new series every time, so renaming or reindexing it doesn't leak
+        # into other callers.
+        return pd.Series(self._cache, copy=False)
+
+    def __copy__(self) -> "TimeAxis":
+        new = self.__class__.__new__(self.__class__)
+        new.duration = self.duration
+        new.rate = self.rate
+        new.start = self.start
+        new.dtype = self.dtype
+        new._cache = self._cache
+        new._cache_key = self._cache_key
+        if hasattr(self, "__dict__"):
+            # Attributes set by subclasses without `__slots__`.
+            new.__dict__.update(self.__dict__)
+        return new
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "TimeAxis":
+        # The slotted attributes are plain numbers and a dtype, so copying them
+        # is enough. The cached series is read-only and only reused while its key
+        # still matches the copy's attributes, so it can be shared.
+        new = self.__copy__()
+        memo[id(self)] = new
+        if hasattr(self, "__dict__"):
+            new.__dict__.update(deepcopy(self.__dict__, memo))
+        return new
 
     def __repr__(self) -> str:
-        base_args = {
+        base_args: Dict[str, Any] = {
             "duration": self.duration,
             "rate": self.rate,
             "start": self.start,
         }
+        if self.dtype != np.float64:
+            base_args["dtype"] = self.dtype.name
         args_list = [f"{k}={repr(v)}" for k, v in base_args.items()]
         return f"{self.__class__.__name__}({', '.join(args_list)})"
 
@@ -67,6 +305,8 @@ class Signal(ABC):
             Name to give to the signal.
     """
 
+    __slots__ = ("ta", "name")
+
     def __init__(self, ta: Optional[TimeAxis] = None, name: Optional[str] = None):
         self.ta = ta
         self.name = name
@@ -75,6 +315,14 @@ class Signal(ABC):
     def get(self, ta: Optional[TimeAxis] = None) -> pd.Series:
         pass
 
+    def _get_from_array(self, t: np.ndarray) -> Optional[np.ndarray]:
+        """Generate the signal's values at the times in `t`.
+
+        Optional fast path for `Wavematic`. Returns `None` if not implemented, in
+        which case `get` is used instead.
+        """
+        return None
+
 
 class Noise(Signal):
     """Generates noise.
@@ -91,6 +339,10 @@ class Noise(Signal):
             Name to give to the noise signal.
     """
 
+    # `__dict__` keeps the tuning constants below settable both per instance
+    # and, as defaults for all instances, on the class.
+    __slots__ = ("amp", "seed", "__dict__")
+
     octaves = 20
     persistence = 5.0
     lacunarity = 2.0  # 1.5
@@ -127,20 +379,21 @@ class Noise(Signal):
                     "A `TimeAxis` must be either provided or set to `self.ta`."
                 )
         ta_ser = ta.get()
-        out = ta_ser.apply(
-            lambda v: pnoise1(
-                v,
-                octaves=self.octaves,
-                persistence=self.persistence,
-                lacunarity=self.lacunarity,
-                repeat=self.repeat,
-                base=self.seed,
-            )
-            * self.amp
+        t = ta_ser.to_numpy()
+        return pd.Series(self._get_from_array(t), index=t, name=self.name, copy=False)
+
+    def _get_from_array(self, t: np.ndarray) -> np.ndarray:
+        if self.amp == 0.0:
+            return np.zeros(len(t), dtype=t.dtype)
+        noise = _perlin1d(
+            t,
+            octaves=self.octaves,
+            persistence=self.persistence,
+            lacunarity=self.lacunarity,
+            repeat=self.repeat,
+            base=self.seed,
         )
-        out.index = ta_ser
-        out.name = self.name
-        return out
+        return noise.astype(t.dtype) * self.amp
 
     def __repr__(self) -> str:
         base_args = {
@@ -179,6 +432,16 @@ class Wave(Signal):
             If `kind="sawtooth"`, `width` can be given.
     """
 
+    __slots__ = ("_freq", "_omega", "amp", "_phase", "_phi", "disp", "kind", "kwargs")
+
+    # Getters, so SciPy is only imported once a wave needs it.
+    _FUNCS = {
+        "sine": lambda: np.sin,
+        "square": lambda: _get_signal().square,
+        "sawtooth": lambda: _get_signal().sawtooth,
+    }
+    _PI = np.pi
+
     def __init__(
         self,
         ta: Optional[TimeAxis] = None,
@@ -199,6 +462,28 @@ class Wave(Signal):
         self.name = name
         self.kwargs = kwargs
 
+    @property
+    def freq(self) -> float:
+        """Frequency."""
+        return self._freq
+
+    @freq.setter
+    def freq(self, freq: float):
+        self._freq = freq
+        # Angular frequency, kept in sync so it isn't recomputed on every call.
+        self._omega = 2 * self._PI * freq
+
+    @property
+    def phase(self) -> float:
+        """Phase, in Pi."""
+        return self._phase
+
+    @phase.setter
+    def phase(self, phase: float):
+        self._phase = phase
+        # Phase in radians, kept in sync so it isn't recomputed on every call.
+        self._phi = self._PI * phase
+
     def get(self, ta: Optional[TimeAxis] = None) -> pd.Series:
         """Generate the wave signal.
 
@@ -218,35 +503,68 @@ class Wave(Signal):
                     "A `TimeAxis` must be either provided or set to `self.ta`."
                 )
         ta_ser = ta.get()
-        f = self.freq
+        name = self.name
+
+        t = ta_ser.to_numpy()
+        return pd.Series(self._get_from_array(t), index=t, name=name, copy=False)
+
+    def _get_from_array(self, t: np.ndarray) -> np.ndarray:
+        omega = self._omega
         a = self.amp
-        p = self.phase
+        phi = self._phi
         d = self.disp
         kind = self.kind
-        name = self.name
         kwargs = self.kwargs
 
-        pi = np.pi
-
-        funcs = {
-            "sine": np.sin,
-            "square": signal.square,
-            "sawtooth": signal.sawtooth,
-        }
+        func = self._FUNCS[kind]()
+        if a == 0.0:
+            # Flat signal, the wave itself doesn't matter.
+            return np.full(len(t), d, dtype=t.dtype)
 
-        base = (2 * pi * f * ta_ser) + (pi * p)
+        # Work in place on a single buffer to avoid allocating temporaries.
+        base = np.empty(len(t), dtype=t.dtype)
+        np.multiply(t, omega, out=base)
+        base += phi
 
-        func = funcs[kind]
-        w = (func(base, **kwargs) * a) + d
-        out = pd.Series(np.array(w), index=ta_ser)
-        if name is not None:
-            out.name = name
-        return out
+        if func is np.sin:
+            w = np.sin(base, out=base, **kwargs)
+        else:
+            # SciPy's generators always return double precision.
+            w = func(base, **kwargs).astype(t.dtype, copy=False)
+        w *= a
+        w += d
+        return w
 
     def copy(self) -> "Wave":
         """Create a shallow copy of itself."""
         return copy(self)
 
+    def __copy__(self) -> "Wave":
+        new = self.__class__.__new__(self.__class__)
+        new.ta = self.ta
+        new.name = self.name
+        new._freq = self._freq
+        new._omega = self._omega
+        new.amp = self.amp
+        new._phase = self._phase
+        new._phi = self._phi
+        new.disp = self.disp
+        new.kind = self.kind
+        new.kwargs = self.kwargs
+        if hasattr(self, "__dict__"):
+            # Attributes set by subclasses without `__slots__`.
+            new.__dict__.update(self.__dict__)
+        return new
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Wave":
+        new = self.__copy__()
+        memo[id(self)] = new
+        new.ta = deepcopy(self.ta, memo)
+        new.kwargs = deepcopy(self.kwargs, memo)
+        if hasattr(self, "__dict__"):
+            new.__dict__.update(deepcopy(self.__dict__, memo))
+        return new
+
     def __repr__(self) -> str:
         base_args = {
             "ta": self.ta,
@@ -272,6 +590,10 @@ class Wavematic(Signal):
             The name to give to the resulting signal.
     """
 
+    # `__dict__` keeps `force_self_ta` settable both per instance and, as a
+    # default for all instances, on the class.
+    __slots__ = ("signals", "__dict__")
+
     force_self_ta: bool = False
 
     def __init__(self, ta: Optional[TimeAxis] = None, name: Optional[str] = None):
@@ -284,6 +606,22 @@ class Wavematic(Signal):
         """Create a deep copy of itself."""
         return deepcopy(self)
 
+    def __copy__(self) -> "Wavematic":
+        new = self.__class__.__new__(self.__class__)
+        new.ta = self.ta
+        new.name = self.name
+        new.__dict__.update(self.__dict__)
+        new.signals = list(self.signals)
+        return new
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Wavematic":
+        new = self.__copy__()
+        memo[id(self)] = new
+        new.__dict__.update(deepcopy(self.__dict__, memo))
+        new.ta = deepcopy(self.ta, memo)
+        new.signals = [deepcopy(sig, memo) for sig in self.signals]
+        return new
+
     def add_signal(self, sig: Signal) -> "Wavematic":
         """Add a signal.
 
@@ -316,23 +654,117 @@ class Wavematic(Signal):
         else:
             return NotImplemented
 
-    def all_signals(self, ta: Optional[TimeAxis] = None) -> pd.DataFrame:
-        """Group all signals."""
-        out = pd.DataFrame()
+    def _collect_signals(self, ta: Optional[TimeAxis] = None) -> List[pd.Series]:
+        """Generate each contained signal."""
+        # Signals sharing the base time axis are generated from a single array
+        # instead of each one regenerating it.
+        base_ta = ta if ta is not None else self.ta
+        if base_ta is not None:
+            base_t = base_ta.get().to_numpy()
+            base_index = pd.Index(base_t)
+
+        series_list = []
         for i, sig in enumerate(self.signals):
 
-            if ta is None:
-                if sig.ta is None or self.force_self_ta:
-                    ta = self.ta
+            if ta is not None or sig.ta is None or self.force_self_ta:
+                if base_ta is None:
+                    raise MissingTimeAxis(
+                        "A `TimeAxis` must be either provided or set to `self.ta`."
+                    )
+                values = sig._get_from_array(base_t)
+                if values is not None:
+                    s = pd.Series(values, index=base_index, name=sig.name, copy=False)
+                else:
+                    # Keep the signal's own index, `_frame` aligns it if needed.
+                    s = sig.get(base_ta)
+            else:
+                s = sig.get()
 
-            s = sig.get(ta)
             if s.name is None:
                 s.name = i
-            out = out.join(s, how="outer")
+            series_list.append(s)
+        return series_list
+
+    @staticmethod
+    def _stack(series_list: List[pd.Series]) -> Optional[np.ndarray]:
+        """Stack signals into a row-major array, one column per signal.
+
+        Returns `None` if there are no signals or if they don't all share the
+        same index, in which case they have to be aligned first.
+        """
+
+        if not series_list:
+            return None
+        index = series_list[0].index
+        if not all(s.index.equals(index) for s in series_list[1:]):
+            return None
+
+        dtype = np.result_type(*(s.dtype for s in series_list))
+        out = np.empty((len(index), len(series_list)), dtype=dtype, order="C")
+        for i, s in enumerate(series_list):
+            out[:, i] = s.to_numpy()
         return out
 
+    @classmethod
+    def _frame(cls, series_list: List[pd.Series]) -> pd.DataFrame:
+        """Group signals in a DataFrame, aligning them if needed."""
+        stacked = cls._stack(series_list)
+        if stacked is not None:
+            return pd.DataFrame(
+                stacked,
+                index=series_list[0].index,
+                columns=[s.name for s in series_list],
+            )
+        if not series_list:
+            return pd.DataFrame()
+        return pd.concat(series_list, axis=1, sort=True)
+
+    def all_signals(self, ta: Optional[TimeAxis] = None) -> pd.DataFrame:
+        """Group all signals."""
+        return self._frame(self._collect_signals(ta))
+
+    def _accumulate(self, ta: Optional[TimeAxis] = None) -> Optional[pd.Series]:
+        """Add up all signals on the base time axis into a single array.
+
+        Returns `None` if there are no signals, no base time axis, or if a
+        signal's time axis doesn't match the base one, in which case the
+        signals have to be aligned first.
+        """
+
+        base_ta = ta if ta is not None else self.ta
+        if not self.signals or base_ta is None:
+            return None
+        base_ser = base_ta.get()
+        t = base_ser.to_numpy()
+
+        total = np.zeros(len(t), dtype=t.dtype)
+        for sig in self.signals:
+            if ta is not None or sig.ta is None or self.force_self_ta:
+                values = sig._get_from_array(t)
+                if values is None:
+                    s = sig.get(base_ta)
+                    if not np.array_equal(s.index, t):
+                        return None
+                    values = s.to_numpy()
+            else:
+                # Check the signal's own axis before generating anything, so a
+                # mismatch doesn't waste work before falling back.
+                if not np.array_equal(sig.ta.get().to_numpy(), t):
+                    return None
+                s = sig.get()
+                if not np.array_equal(s.index, t):
+                    return None
+                values = s.to_numpy()
+            # Skip NaNs, like `DataFrame.sum` does on the aligned fallback.
+            np.add(total, values, out=total, where=~np.isnan(values))
+        return pd.Series(total, index=t, name=self.name, copy=False)
+
     def get(self, ta: Optional[TimeAxis] = None) -> pd.Series:
         """Generate the signal resulting from the addition of contained signals."""
+        out = self._accumulate(ta)
+        if out is not None:
+            return out
+
         out = self.all_signals(ta).sum(axis=1)
         name = self.name
         if name is not None: